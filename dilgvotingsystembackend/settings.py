@@ -93,6 +93,17 @@ DATABASES = {
 
 
 
+# Shared cache (needs the redis package). Session lookups, login lockouts,
+# the active election and ballot positions are cached and invalidated
+# across all workers, so a per-process cache is not an option here.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://127.0.0.1:6379/1',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -112,6 +123,17 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Django's defaults first (staff passwords), then the voter PIN hasher.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+    'elections.hashers.PinPBKDF2PasswordHasher',
+]
+
+
 CORS_ALLOW_ALL_ORIGINS = True
 
 CORS_ALLOW_HEADERS = list(default_headers) + [
@@ -142,5 +164,7 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
+# Uploads get unique file names, so MEDIA_URL can point at a CDN that
+# caches them as immutable; Django only serves media itself when DEBUG.
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
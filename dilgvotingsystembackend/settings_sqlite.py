@@ -7,4 +7,11 @@ DATABASES = {
     }
 }
 
-ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
\ No newline at end of file
+ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
+
+# Local development runs one process, so the in-memory cache is enough.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
@@ -1,6 +1,17 @@
 # elections/admin.py
+from functools import lru_cache, partial
+
 from django.contrib import admin, messages
+from django.contrib.admin.utils import quote
+from django.contrib.admin.views.main import ChangeList
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.urls import get_script_prefix, reverse
+from django.utils.functional import cached_property
+from django.utils.html import format_html
 
+from .caching import invalidate_position_tally
 from .models import (
     Candidate,
     Election,
@@ -13,8 +24,136 @@ from .models import (
 )
 
 
+# Below this many rows an exact COUNT(*) is cheap enough to keep.
+ESTIMATED_COUNT_THRESHOLD = 10000
+
+
+def estimated_row_count(using, table):
+    """Return the planner's row estimate for a table, or None if unsupported."""
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        sql = "SELECT reltuples::bigint FROM pg_class WHERE relname = %s"
+    elif connection.vendor == "mysql":
+        sql = (
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = %s"
+        )
+    else:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+    if not row or row[0] is None:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """Skip COUNT(*) on large unfiltered change lists; use the table estimate."""
+
+    @cached_property
+    def count(self):
+        qs = self.object_list
+        if not qs.query.where:
+            estimate = estimated_row_count(qs.db, qs.model._meta.db_table)
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+FILTER_CHOICES_TIMEOUT = 60  # seconds
+
+
+class CachedRelatedFieldListFilter(admin.RelatedFieldListFilter):
+    """Related-field filter whose sidebar choices are cached briefly.
+
+    Building the choices runs a query plus one __str__ per option; the
+    option list rarely changes between page loads.
+    """
+
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        key = "admin-filter-choices:%s:%s:%s" % (
+            field.model._meta.label_lower,
+            field.name,
+            ",".join(map(str, ordering)),
+        )
+        choices = cache.get(key)
+        if choices is None:
+            choices = super().field_choices(field, request, model_admin)
+            cache.set(key, choices, FILTER_CHOICES_TIMEOUT)
+        return choices
+
+
+class SlimForeignKeyMixin:
+    """Load only what each related object's __str__ needs for FK dropdowns."""
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name in ("voter", "nominator"):
+            kwargs["queryset"] = Voter.objects.only("id", "name", "voter_id")
+        elif db_field.name == "candidate":
+            kwargs["queryset"] = Candidate.objects.select_related("position").only(
+                "id", "full_name", "position__name"
+            )
+        elif db_field.name == "position":
+            kwargs["queryset"] = Position.objects.select_related("election").only(
+                "id", "name", "election__name"
+            )
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+
+PK_PLACEHOLDER = "__pk__"
+
+
+@lru_cache(maxsize=None)
+def change_url_template(url_name, current_app, script_prefix):
+    """Reverse an admin change URL once, leaving a placeholder for the pk.
+
+    script_prefix is only part of the cache key; reverse() reads it itself.
+    """
+    return reverse(url_name, args=(PK_PLACEHOLDER,), current_app=current_app)
+
+
+class CachedUrlChangeList(ChangeList):
+    """ChangeList that builds row links without a reverse() per row."""
+
+    def url_for_result(self, result):
+        template = change_url_template(
+            "admin:%s_%s_change" % (self.opts.app_label, self.opts.model_name),
+            self.model_admin.admin_site.name,
+            get_script_prefix(),
+        )
+        return template.replace(PK_PLACEHOLDER, str(quote(getattr(result, self.pk_attname))))
+
+
+class AppModelAdmin(admin.ModelAdmin):
+    def get_changelist(self, request, **kwargs):
+        return CachedUrlChangeList
+
+
+class VoterChangeList(CachedUrlChangeList):
+    """Fetch only the columns the voter change list renders (no PIN hashes)."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .only(
+                "id",
+                "name",
+                "voter_id",
+                "batch_year",
+                "campus_chapter",
+                "is_active",
+                "has_voted",
+                # read by the Voter delete signal
+                "session_token",
+            )
+        )
+
+
 @admin.register(Election)
-class ElectionAdmin(admin.ModelAdmin):
+class ElectionAdmin(AppModelAdmin):
     list_display = (
         "name",
         "nomination_start",
@@ -28,22 +167,43 @@ class ElectionAdmin(admin.ModelAdmin):
 
 
 @admin.register(Position)
-class PositionAdmin(admin.ModelAdmin):
+class PositionAdmin(AppModelAdmin):
     list_display = ("name", "election", "display_order", "is_active")
-    list_filter = ("election", "is_active")
+    list_filter = (("election", CachedRelatedFieldListFilter), "is_active")
     search_fields = ("name",)
     ordering = ("display_order", "name")
 
+    def get_queryset(self, request):
+        # __str__ includes the election name (change form, autocomplete).
+        return super().get_queryset(request).select_related("election")
+
 
 @admin.register(Candidate)
-class CandidateAdmin(admin.ModelAdmin):
-    list_display = ("full_name", "position", "batch_year", "is_official")
-    list_filter = ("position", "is_official")
+class CandidateAdmin(AppModelAdmin):
+    list_display = ("photo_thumbnail", "full_name", "position", "batch_year", "is_official")
+    list_display_links = ("full_name",)
+    list_filter = (("position", CachedRelatedFieldListFilter), "is_official")
     search_fields = ("full_name", "position__name")
 
+    @admin.display(description="Photo")
+    def photo_thumbnail(self, obj):
+        # Served from MEDIA_URL (a CDN in production), fetched only on scroll.
+        if not obj.photo:
+            return "-"
+        return format_html(
+            '<img src="{}" alt="" width="40" height="40" loading="lazy" style="object-fit: cover;">',
+            obj.photo.url,
+        )
+
+    def get_queryset(self, request):
+        # __str__ needs the position (change form, autocomplete); the change
+        # list's position column also needs its election. ChangeList ignores
+        # list_select_related once this queryset has a select_related().
+        return super().get_queryset(request).select_related("position__election")
+
 
 @admin.register(Voter)
-class VoterAdmin(admin.ModelAdmin):
+class VoterAdmin(AppModelAdmin):
     list_display = (
         "name",
         "voter_id",
@@ -56,9 +216,23 @@ class VoterAdmin(admin.ModelAdmin):
     search_fields = ("name", "voter_id", "email", "campus_chapter")
     readonly_fields = ("voter_id",)
 
+    def get_changelist(self, request, **kwargs):
+        return VoterChangeList
+
+    def formfield_for_dbfield(self, db_field, request, **kwargs):
+        formfield = super().formfield_for_dbfield(db_field, request, **kwargs)
+        if db_field.name == "pin":
+            formfield.help_text = (
+                "Stored hashed. Type a new PIN to replace it; it is hashed on save."
+            )
+        return formfield
+
     def save_model(self, request, obj, form, change):
         new_pin = None
-        if not change and not obj.pin:
+        if "pin" in form.changed_data and obj.pin:
+            # A PIN typed into the form arrives raw.
+            obj.set_pin(obj.pin)
+        elif not change and not obj.pin:
             raw_pin = generate_pin()
             obj.set_pin(raw_pin)
             new_pin = raw_pin
@@ -72,14 +246,33 @@ class VoterAdmin(admin.ModelAdmin):
 
 
 @admin.register(Vote)
-class VoteAdmin(admin.ModelAdmin):
+class VoteAdmin(SlimForeignKeyMixin, AppModelAdmin):
     list_display = ("voter", "position", "candidate", "created_at")
-    list_filter = ("position", "candidate")
+    list_filter = (
+        ("position", CachedRelatedFieldListFilter),
+        ("candidate", CachedRelatedFieldListFilter),
+    )
     search_fields = ("voter__name", "candidate__full_name")
+    autocomplete_fields = ("voter", "position", "candidate")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # Position.__str__ and Candidate.__str__ reach one level further
+    list_select_related = ("voter", "position__election", "candidate__position")
+
+    # Vote has no delete signal; drop each affected tally once.
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        transaction.on_commit(partial(invalidate_position_tally, obj.position_id))
+
+    def delete_queryset(self, request, queryset):
+        position_ids = set(queryset.values_list("position_id", flat=True))
+        super().delete_queryset(request, queryset)
+        for position_id in position_ids:
+            transaction.on_commit(partial(invalidate_position_tally, position_id))
 
 
 @admin.register(Nomination)
-class NominationAdmin(admin.ModelAdmin):
+class NominationAdmin(SlimForeignKeyMixin, AppModelAdmin):
     list_display = (
         "nominee_full_name",
         "position",
@@ -88,17 +281,33 @@ class NominationAdmin(admin.ModelAdmin):
         "nominee_batch_year",
         "created_at",
     )
-    list_filter = ("election", "position", "is_good_standing")
+    list_filter = (
+        ("election", CachedRelatedFieldListFilter),
+        ("position", CachedRelatedFieldListFilter),
+        "is_good_standing",
+    )
     search_fields = (
         "nominee_full_name",
         "nominator__name",
         "position__name",
         "election__name",
     )
+    autocomplete_fields = ("election", "position", "nominator")
+    list_select_related = ("position__election", "election", "nominator")
+    actions = ("promote_selected",)
+
+    @admin.action(description="Promote selected nominations to candidates")
+    def promote_selected(self, request, queryset):
+        created = Candidate.promote_bulk(queryset.filter(promoted=False))
+        self.message_user(
+            request,
+            f"{len(created)} candidate(s) created.",
+            level=messages.SUCCESS,
+        )
 
 
 @admin.register(ElectionReminder)
-class ElectionReminderAdmin(admin.ModelAdmin):
+class ElectionReminderAdmin(AppModelAdmin):
     list_display = ("election", "remind_at", "note")
-    list_filter = ("election",)
+    list_filter = (("election", CachedRelatedFieldListFilter),)
     search_fields = ("note",)
@@ -0,0 +1,182 @@
+# elections/caching.py
+from django.core.cache import cache
+from django.db.models import Count
+
+from .models import Election, Position, Vote, Voter
+
+
+TALLY_TIMEOUT = 30  # seconds; Vote signals invalidate sooner
+
+
+def tally_cache_key(position_id):
+    return f"tally:{position_id}"
+
+
+def get_position_tallies(position_ids):
+    """
+    Return {position_id: {candidate_id: vote count}} for several positions.
+    Cache hits come from one get_many(); misses share one grouped query.
+    """
+    keys = {tally_cache_key(position_id): position_id for position_id in position_ids}
+    tallies = {keys[key]: tally for key, tally in cache.get_many(keys).items()}
+    missing = [position_id for position_id in keys.values() if position_id not in tallies]
+    if missing:
+        fresh = {position_id: {} for position_id in missing}
+        rows = (
+            Vote.objects.filter(position_id__in=missing)
+            .order_by()
+            .values_list("position_id", "candidate_id")
+            .annotate(votes=Count("id"))
+        )
+        for position_id, candidate_id, votes in rows:
+            fresh[position_id][candidate_id] = votes
+        cache.set_many(
+            {tally_cache_key(position_id): tally for position_id, tally in fresh.items()},
+            TALLY_TIMEOUT,
+        )
+        tallies.update(fresh)
+    return tallies
+
+
+def invalidate_position_tally(position_id):
+    cache.delete(tally_cache_key(position_id))
+
+
+# PIN lockout: with ~1M possible PINs, throttling guesses is what protects
+# an account, not the hash iteration count. Attempts are counted per voter
+# ID and client address, so knowing a voter ID is not enough to lock the
+# real voter out from their own device.
+LOGIN_MAX_ATTEMPTS = 5
+LOGIN_LOCKOUT_TIMEOUT = 15 * 60  # seconds
+
+
+def login_attempts_key(voter_id, client_ip):
+    return f"login-attempts:{client_ip}:{voter_id}"
+
+
+def record_login_attempt(voter_id, client_ip):
+    """
+    Count a login attempt and return the count so far in this window.
+    add()/incr() are atomic, so parallel guesses cannot all see a low count.
+    """
+    key = login_attempts_key(voter_id, client_ip)
+    if cache.add(key, 1, LOGIN_LOCKOUT_TIMEOUT):
+        return 1
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Expired between add() and incr().
+        cache.set(key, 1, LOGIN_LOCKOUT_TIMEOUT)
+        return 1
+
+
+def clear_login_attempts(voter_id, client_ip):
+    cache.delete(login_attempts_key(voter_id, client_ip))
+
+
+# Voter lookups by session token, so polling endpoints (voter/me) skip the
+# DB. Entries are dropped on logout, ballot submit, voter saves and resets.
+SESSION_TIMEOUT = 30  # seconds
+
+
+def voter_session_key(session_token):
+    return f"voter-session:{session_token.hex}"
+
+
+def get_session_voter(session_token):
+    """Return the active voter holding this session token (a UUID), or None."""
+    key = voter_session_key(session_token)
+    voter = cache.get(key)
+    if voter is None:
+        # Session views never read the PIN hash or timestamps.
+        voter = (
+            Voter.objects.defer("pin", "created_at", "updated_at")
+            .filter(session_token=session_token, is_active=True)
+            .first()
+        )
+        if voter is None:
+            return None
+        cache.set(key, voter, SESSION_TIMEOUT)
+    return voter
+
+
+def invalidate_voter_sessions(session_tokens):
+    cache.delete_many([voter_session_key(token) for token in session_tokens if token])
+
+
+# Whole admin dashboard responses; polled often, rebuilt at most every few
+# seconds. Ballot submits and resets drop them right away.
+ADMIN_DASHBOARD_TIMEOUT = 5  # seconds
+ADMIN_STATS_CACHE_KEY = "admin-stats"
+
+
+def admin_tally_cache_key(election_id):
+    return f"admin-tally:{election_id}"
+
+
+def invalidate_admin_dashboard(election_id=None):
+    keys = [ADMIN_STATS_CACHE_KEY]
+    if election_id is not None:
+        keys.append(admin_tally_cache_key(election_id))
+    cache.delete_many(keys)
+
+
+# The active election is read by nearly every endpoint and changes only
+# through an Election save (signals drop it).
+ACTIVE_ELECTION_TIMEOUT = 30  # seconds
+ACTIVE_ELECTION_CACHE_KEY = "active-election"
+
+
+def get_cached_active_election():
+    cached = cache.get(ACTIVE_ELECTION_CACHE_KEY)
+    if cached is None:
+        # Wrapped in a tuple so "no active election" is cached too.
+        cached = (
+            Election.objects.filter(is_active=True).order_by("-nomination_start").first(),
+        )
+        cache.set(ACTIVE_ELECTION_CACHE_KEY, cached, ACTIVE_ELECTION_TIMEOUT)
+    return cached[0]
+
+
+def invalidate_active_election():
+    cache.delete(ACTIVE_ELECTION_CACHE_KEY)
+
+
+# Published results, keyed by publish time so republishing starts a new
+# entry. Ballot submits and election resets drop the current one.
+RESULTS_TIMEOUT = 60  # seconds
+
+
+def results_cache_key(election):
+    published_at = election.results_published_at
+    version = published_at.timestamp() if published_at else 0
+    return f"results:{election.id}:v{version}"
+
+
+def invalidate_published_results(election):
+    cache.delete(results_cache_key(election))
+
+
+# Active positions of an election as (id, name) pairs, in id order. Read on
+# every ballot submit; Position signals drop the entry on any change.
+ACTIVE_POSITIONS_TIMEOUT = 5 * 60  # seconds
+
+
+def active_positions_key(election_id):
+    return f"positions:{election_id}"
+
+
+def get_active_positions(election_id):
+    return cache.get_or_set(
+        active_positions_key(election_id),
+        lambda: list(
+            Position.objects.filter(election_id=election_id, is_active=True)
+            .order_by("id")
+            .values_list("id", "name")
+        ),
+        ACTIVE_POSITIONS_TIMEOUT,
+    )
+
+
+def invalidate_active_positions(election_id):
+    cache.delete(active_positions_key(election_id))
@@ -0,0 +1,37 @@
+# elections/hashers.py
+import base64
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+try:
+    from fastpbkdf2 import pbkdf2_hmac
+except ImportError:
+    pbkdf2_hmac = None
+
+
+class PinPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 tuned for short numeric voter PINs.
+
+    A 6-digit PIN has ~20 bits of entropy, so a high iteration count adds
+    little against offline guessing but makes every voter login slow.
+
+    The derivation itself already runs natively: django.utils.crypto.pbkdf2
+    wraps hashlib.pbkdf2_hmac (OpenSSL), not a Python-level HMAC loop.
+    When fastpbkdf2 is installed it is used instead; it keeps the keyed
+    HMAC state across iterations and produces identical hashes.
+    """
+
+    algorithm = "pbkdf2_pin"
+    iterations = 10000
+
+    def encode(self, password, salt, iterations=None):
+        if pbkdf2_hmac is None:
+            return super().encode(password, salt, iterations)
+        self._check_encode_args(password, salt)
+        iterations = iterations or self.iterations
+        hash = pbkdf2_hmac(
+            self.digest().name, password.encode(), salt.encode(), iterations
+        )
+        hash = base64.b64encode(hash).decode("ascii").strip()
+        return "%s$%d$%s$%s" % (self.algorithm, iterations, salt, hash)
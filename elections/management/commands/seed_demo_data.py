@@ -4,12 +4,14 @@ from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
+from elections.caching import invalidate_active_positions
 from elections.models import (
     Candidate,
     Election,
     Nomination,
     Position,
     Voter,
+    hash_pin,
 )
 
 
@@ -47,7 +49,7 @@ class Command(BaseCommand):
                 "is_active": True,
             },
         )
-        if not created:
+        if not created and not election.is_active:
             election.is_active = True
             election.save(update_fields=["is_active"])
         self.stdout.write(f"Election: {election} (created={created})")
@@ -64,40 +66,54 @@ class Command(BaseCommand):
             "auditor",
             "pro",
         ]
-        for idx, name in enumerate(names):
-            pos, _ = Position.objects.get_or_create(
-                election=election,
-                name=name,
-                defaults={"display_order": idx, "is_active": True},
-            )
-            positions[name] = pos
+        # (election, name) is unique, so existing positions are skipped.
+        Position.objects.bulk_create(
+            [
+                Position(election=election, name=name, display_order=idx, is_active=True)
+                for idx, name in enumerate(names)
+            ],
+            ignore_conflicts=True,
+        )
+        # bulk_create skips the post_save signal
+        invalidate_active_positions(election.id)
+        for pos in Position.objects.filter(election=election, name__in=names):
+            positions[pos.name] = pos
         self.stdout.write(f"Positions created/ensured: {len(positions)}")
         return positions
 
     def _create_voters(self):
-        voters = {}
         voter_seed = [
             ("HCAD-0001", "Giovanni Kish Basilgo", 1998, "Main Campus", "president@hcadaa.org", "09170000001"),
             ("HCAD-0002", "Lyzle Mahinay", 1999, "Digos Chapter", "comelec@hcadaa.org", "09170000002"),
             ("HCAD-0003", "Sample Alumna", 2005, "USA Chapter", "sample1@example.com", "09170000003"),
             ("HCAD-0004", "Sample Alumnus", 2006, "Davao Chapter", "sample2@example.com", "09170000004"),
         ]
-        for code, name, batch, campus, email, phone in voter_seed:
-            voter, _ = Voter.objects.get_or_create(
-                voter_id=code,
-                defaults={
-                    "name": name,
-                    "batch_year": batch,
-                    "campus_chapter": campus,
-                    "email": email,
-                    "phone": phone,
-                    "privacy_consent": True,
-                    "is_active": True,
-                },
-            )
-            voter.set_pin("123456")
-            voter.save()
-            voters[code] = voter
+        # Every demo voter shares one PIN, so hash it once.
+        hashed_pin = hash_pin("123456")
+        Voter.objects.bulk_create(
+            [
+                Voter(
+                    voter_id=code,
+                    name=name,
+                    batch_year=batch,
+                    campus_chapter=campus,
+                    email=email,
+                    phone=phone,
+                    privacy_consent=True,
+                    is_active=True,
+                    pin=hashed_pin,
+                )
+                for code, name, batch, campus, email, phone in voter_seed
+            ],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+        codes = [code for code, *_ in voter_seed]
+        # Existing voters keep their profile but get the demo PIN back.
+        Voter.objects.filter(voter_id__in=codes).update(
+            pin=hashed_pin, updated_at=timezone.now()
+        )
+        voters = Voter.objects.in_bulk(codes, field_name="voter_id")
         self.stdout.write(f"Voters created/updated: {len(voters)} (PIN=123456)")
         return voters
 
@@ -114,18 +130,28 @@ class Command(BaseCommand):
             "auditor": [("Grace Santos", 2002, "Main Campus")],
             "pro": [("Henry Ong", 2005, "USA Chapter")],
         }
+        # No unique constraint on (position, full_name); check in memory.
+        existing = set(
+            Candidate.objects.filter(position__in=positions.values()).values_list(
+                "position_id", "full_name"
+            )
+        )
+        new_candidates = []
         for key, entries in candidate_seed.items():
             pos = positions[key]
             for full_name, batch_year, campus in entries:
-                Candidate.objects.get_or_create(
-                    position=pos,
-                    full_name=full_name,
-                    defaults={
-                        "batch_year": batch_year,
-                        "campus_chapter": campus,
-                        "is_official": True,
-                    },
+                if (pos.id, full_name) in existing:
+                    continue
+                new_candidates.append(
+                    Candidate(
+                        position=pos,
+                        full_name=full_name,
+                        batch_year=batch_year,
+                        campus_chapter=campus,
+                        is_official=True,
+                    )
                 )
+        Candidate.objects.bulk_create(new_candidates, batch_size=500)
         self.stdout.write("Candidates created/ensured: done")
 
     def _create_nominations(self, election, positions, voters):
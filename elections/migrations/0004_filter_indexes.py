@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0003_election_results_published_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='candidate',
+            name='full_name',
+            field=models.CharField(db_index=True, max_length=150),
+        ),
+        migrations.AlterField(
+            model_name='position',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name='vote',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='voter',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0004_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['position', 'candidate'], name='vote_pos_cand_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:23
+
+from django.db import migrations, models
+
+
+def clear_session_tokens(apps, schema_editor):
+    # Dashed 36-char tokens do not fit the 32-char UUID column on MySQL;
+    # voters simply log in again.
+    Voter = apps.get_model("elections", "Voter")
+    Voter.objects.exclude(session_token=None).update(session_token=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0005_vote_pos_cand_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_session_tokens, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='voter',
+            name='session_token',
+            field=models.UUIDField(blank=True, null=True, unique=True),
+        ),
+    ]
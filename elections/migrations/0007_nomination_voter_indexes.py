@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0006_voter_session_token_uuid'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='nomination',
+            index=models.Index(fields=['election', 'promoted'], name='nomination_elec_promoted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='voter',
+            index=models.Index(fields=['has_voted', 'is_active'], name='voter_voted_active_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0007_nomination_voter_indexes'),
+    ]
+
+    operations = [
+        # Add the new constraint before dropping the old one so votes are
+        # never left unconstrained.
+        migrations.AddConstraint(
+            model_name='vote',
+            constraint=models.UniqueConstraint(fields=('voter', 'position'), name='uniq_voter_position'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='vote',
+            unique_together=set(),
+        ),
+    ]
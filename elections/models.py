@@ -4,7 +4,7 @@ import string
 import uuid
 
 from django.contrib.auth.hashers import check_password, make_password
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.utils import timezone
 from django.contrib.auth.models import User
 
@@ -13,12 +13,33 @@ from django.contrib.auth.models import User
 #  HELPERS
 # -------------------------
 
+VOTER_ID_DIGITS = 7  # 10M codes keeps collisions rare for any real roster
+VOTER_ID_ATTEMPTS = 5
+
+
 def generate_voter_id():
-    """Create a simple unique voter ID like HCAD-1234."""
-    while True:
-        code = "HCAD-" + "".join(secrets.choice(string.digits) for _ in range(4))
-        if not Voter.objects.filter(voter_id=code).exists():
-            return code
+    """Create a random voter ID like HCAD-1234567.
+
+    Uniqueness is left to the voter_id unique index; Voter.save() retries
+    with a fresh code on collision instead of checking beforehand.
+    """
+    return "HCAD-" + "".join(secrets.choice(string.digits) for _ in range(VOTER_ID_DIGITS))
+
+
+def generate_voter_ids(count: int):
+    """Create count distinct, unused voter IDs for bulk_create.
+
+    bulk_create skips Voter.save() and its retry, so check the whole batch
+    in one query and redraw only the codes already taken.
+    """
+    codes = set()
+    while len(codes) < count:
+        batch = {generate_voter_id() for _ in range(count - len(codes))} - codes
+        taken = set(
+            Voter.objects.filter(voter_id__in=batch).values_list("voter_id", flat=True)
+        )
+        codes |= batch - taken
+    return list(codes)
 
 
 def generate_pin(length: int = 6):
@@ -26,6 +47,14 @@ def generate_pin(length: int = 6):
     return "".join(secrets.choice(string.digits) for _ in range(length))
 
 
+PIN_HASHER = "pbkdf2_pin"
+
+
+def hash_pin(raw_pin: str):
+    """Hash a raw PIN with the dedicated PIN hasher."""
+    return make_password(raw_pin, hasher=PIN_HASHER)
+
+
 # -------------------------
 #  CORE MODELS
 # -------------------------
@@ -84,6 +113,8 @@ POSITION_CHOICES = (
     ("auditor", "Auditor"),
     ("pro", "Public Relations Officer"),
 )
+# get_name_display() rebuilds a choices dict on every call.
+POSITION_DISPLAY = dict(POSITION_CHOICES)
 
 
 class Position(models.Model):
@@ -93,7 +124,7 @@ class Position(models.Model):
         related_name="positions",
     )
     name = models.CharField(max_length=120, choices=POSITION_CHOICES)
-    is_active = models.BooleanField(default=True)
+    is_active = models.BooleanField(default=True, db_index=True)
     seats = models.PositiveIntegerField(default=1)
     display_order = models.PositiveIntegerField(default=0)
 
@@ -115,39 +146,59 @@ class Voter(models.Model):
     privacy_consent = models.BooleanField(default=False)
     pin = models.CharField(max_length=128, blank=True)  # hashed
     has_voted = models.BooleanField(default=False)
-    is_active = models.BooleanField(default=True)
-    session_token = models.CharField(max_length=36, blank=True, null=True, unique=True)
+    is_active = models.BooleanField(default=True, db_index=True)
+    session_token = models.UUIDField(blank=True, null=True, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            # Turnout counts; also serves has_voted-only filters.
+            models.Index(fields=["has_voted", "is_active"], name="voter_voted_active_idx"),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.voter_id})"
 
     # session helpers
+    # Single-column UPDATEs; no need to go through save().
     def start_session(self):
-        self.session_token = str(uuid.uuid4())
-        self.save(update_fields=["session_token"])
+        self.session_token = uuid.uuid4()
+        Voter.objects.filter(pk=self.pk).update(session_token=self.session_token)
 
     def end_session(self):
         self.session_token = None
-        self.save(update_fields=["session_token"])
+        Voter.objects.filter(pk=self.pk).update(session_token=None)
 
     # pin helpers
     def set_pin(self, raw_pin: str):
-        self.pin = make_password(raw_pin)
+        self.pin = hash_pin(raw_pin)
 
     def check_pin(self, raw_pin: str) -> bool:
-        return check_password(raw_pin, self.pin)
+        # PINs hashed with the old default hasher are rehashed on login.
+        def setter(raw_pin):
+            self.set_pin(raw_pin)
+            self.save(update_fields=["pin"])
 
+        return check_password(raw_pin, self.pin, setter, preferred=PIN_HASHER)
+
+    # pin is stored as given; raw PINs must go through set_pin().
     def save(self, *args, **kwargs):
-        if not self.voter_id:
+        if self.voter_id:
+            super().save(*args, **kwargs)
+            return
+        for attempt in range(VOTER_ID_ATTEMPTS):
             self.voter_id = generate_voter_id()
-        if self.pin and not self.pin.startswith("pbkdf2_"):
-            self.pin = make_password(self.pin)
-        super().save(*args, **kwargs)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                collided = Voter.objects.filter(voter_id=self.voter_id).exists()
+                self.voter_id = ""
+                if not collided or attempt == VOTER_ID_ATTEMPTS - 1:
+                    raise
 
 
 class Nomination(models.Model):
@@ -180,6 +231,10 @@ class Nomination(models.Model):
 
     class Meta:
         unique_together = ("election", "nominator")  # one nomination per voter per election
+        indexes = [
+            # Unpromoted nominations of an election (promotion queue).
+            models.Index(fields=["election", "promoted"], name="nomination_elec_promoted_idx"),
+        ]
         ordering = ["position__display_order", "nominee_full_name"]
 
     def __str__(self):
@@ -192,7 +247,7 @@ class Candidate(models.Model):
         on_delete=models.CASCADE,
         related_name="candidates",
     )
-    full_name = models.CharField(max_length=150)
+    full_name = models.CharField(max_length=150, db_index=True)
     batch_year = models.PositiveIntegerField()
     campus_chapter = models.CharField(max_length=150, blank=True)
     contact_email = models.EmailField(blank=True)
@@ -214,6 +269,46 @@ class Candidate(models.Model):
     def __str__(self):
         return f"{self.full_name} - {self.position.get_name_display()}"
 
+    @classmethod
+    def promote_bulk(cls, nominations):
+        """
+        Create official candidates for the given nominations in one INSERT
+        and mark them promoted in one UPDATE. Nominees already listed under
+        the same position are skipped. Returns the new candidates.
+        """
+        nominations = list(nominations)
+        existing = set(
+            cls.objects.filter(
+                position_id__in={n.position_id for n in nominations}
+            ).values_list("position_id", "full_name")
+        )
+        candidates = []
+        for n in nominations:
+            key = (n.position_id, n.nominee_full_name)
+            if key in existing:
+                continue
+            existing.add(key)
+            candidates.append(
+                cls(
+                    position_id=n.position_id,
+                    full_name=n.nominee_full_name,
+                    batch_year=n.nominee_batch_year,
+                    campus_chapter=n.nominee_campus_chapter,
+                    contact_email=n.contact_email,
+                    contact_phone=n.contact_phone,
+                    bio=n.reason,
+                    photo=n.nominee_photo,
+                    source_nomination=n,
+                    is_official=True,
+                )
+            )
+        with transaction.atomic():
+            cls.objects.bulk_create(candidates, batch_size=500)
+            Nomination.objects.filter(pk__in=[n.pk for n in nominations]).update(
+                promoted=True, promoted_at=timezone.now()
+            )
+        return candidates
+
 
 class Vote(models.Model):
     voter = models.ForeignKey(
@@ -231,11 +326,19 @@ class Vote(models.Model):
         on_delete=models.CASCADE,
         related_name="votes",
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     class Meta:
-        unique_together = ("voter", "position")
         ordering = ["position__display_order", "-created_at"]
+        constraints = [
+            # One vote per voter per position; submit_ballot relies on the
+            # IntegrityError instead of checking first.
+            models.UniqueConstraint(fields=["voter", "position"], name="uniq_voter_position"),
+        ]
+        indexes = [
+            # Tallies group a position's votes by candidate.
+            models.Index(fields=["position", "candidate"], name="vote_pos_cand_idx"),
+        ]
 
     def __str__(self):
         return f"Vote by {self.voter} for {self.candidate} ({self.position})"
@@ -272,7 +375,7 @@ class AdminSession(models.Model):
 
     def refresh_token(self):
         self.token = secrets.token_hex(20)
-        self.save(update_fields=["token"])
+        AdminSession.objects.filter(pk=self.pk).update(token=self.token)
 
     def __str__(self):
         return f"AdminSession for {self.user.username}"
@@ -9,9 +9,17 @@ from .models import (
     Vote,
     Nomination,
     ElectionReminder,
+    POSITION_DISPLAY,
 )
 
 
+class PositionDisplayField(serializers.ReadOnlyField):
+    """Render a Position.name choice as its label."""
+
+    def to_representation(self, value):
+        return POSITION_DISPLAY.get(value, value)
+
+
 class ElectionSerializer(serializers.ModelSerializer):
     phase = serializers.CharField(read_only=True)
 
@@ -34,7 +42,7 @@ class ElectionSerializer(serializers.ModelSerializer):
 
 
 class PositionSerializer(serializers.ModelSerializer):
-    name_display = serializers.CharField(source="get_name_display", read_only=True)
+    name_display = PositionDisplayField(source="name")
 
     class Meta:
         model = Position
@@ -50,7 +58,7 @@ class PositionSerializer(serializers.ModelSerializer):
 
 
 class CandidateSerializer(serializers.ModelSerializer):
-    position_name = serializers.CharField(source="position.get_name_display", read_only=True)
+    position_name = PositionDisplayField(source="position.name")
 
     class Meta:
         model = Candidate
@@ -69,6 +77,11 @@ class CandidateSerializer(serializers.ModelSerializer):
             "source_nomination",
         ]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the relations read by position_name."""
+        return queryset.select_related("position")
+
 
 class VoterSerializer(serializers.ModelSerializer):
     class Meta:
@@ -88,25 +101,22 @@ class VoterSerializer(serializers.ModelSerializer):
         read_only_fields = ["voter_id", "has_voted", "is_active"]
 
 
-class VoterMeSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Voter
-        fields = [
-            "name",
-            "voter_id",
-            "has_voted",
-            "batch_year",
-            "campus_chapter",
-            "email",
-            "phone",
-            "privacy_consent",
-        ]
+class VoterMeSerializer(serializers.Serializer):
+    # Output only; declared explicitly to skip ModelSerializer introspection.
+    name = serializers.CharField(read_only=True)
+    voter_id = serializers.CharField(read_only=True)
+    has_voted = serializers.BooleanField(read_only=True)
+    batch_year = serializers.IntegerField(read_only=True)
+    campus_chapter = serializers.CharField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    phone = serializers.CharField(read_only=True)
+    privacy_consent = serializers.BooleanField(read_only=True)
 
 
 class VoteSerializer(serializers.ModelSerializer):
     voter_name = serializers.CharField(source="voter.name", read_only=True)
     candidate_name = serializers.CharField(source="candidate.full_name", read_only=True)
-    position_name = serializers.CharField(source="position.get_name_display", read_only=True)
+    position_name = PositionDisplayField(source="position.name")
 
     class Meta:
         model = Vote
@@ -152,7 +162,7 @@ class AdminVoterCreateSerializer(serializers.ModelSerializer):
 
 
 class NominationSerializer(serializers.ModelSerializer):
-    position_name = serializers.CharField(source="position.get_name_display", read_only=True)
+    position_name = PositionDisplayField(source="position.name")
     election_name = serializers.CharField(source="election.name", read_only=True)
     nominator_name = serializers.CharField(source="nominator.name", read_only=True)
 
@@ -180,6 +190,31 @@ class NominationSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["nominator", "election", "created_at"]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Join the relations read by the *_name fields, taking only the columns
+        they render (the nominator row would otherwise bring its PIN hash).
+        """
+        return queryset.select_related("election", "position", "nominator").only(
+            "id",
+            "election__name",
+            "position__name",
+            "position__display_order",
+            "nominator__name",
+            "nominee_full_name",
+            "nominee_batch_year",
+            "nominee_campus_chapter",
+            "contact_email",
+            "contact_phone",
+            "reason",
+            "nominee_photo",
+            "is_good_standing",
+            "promoted",
+            "promoted_at",
+            "created_at",
+        )
+
 
 class NominationCreateSerializer(serializers.Serializer):
     position_id = serializers.IntegerField()
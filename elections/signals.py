@@ -0,0 +1,63 @@
+# elections/signals.py
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .caching import (
+    ADMIN_STATS_CACHE_KEY,
+    invalidate_active_election,
+    invalidate_active_positions,
+    invalidate_position_tally,
+    voter_session_key,
+)
+from .models import Candidate, Election, Position, Vote, Voter
+
+# Receivers run inside the saving transaction (the admin wraps every change
+# in one). Invalidating then would let a concurrent request re-cache the
+# old, still-committed rows, so every cache delete waits for the commit;
+# outside a transaction on_commit() runs it immediately.
+
+
+# post_save only: a delete receiver on Vote would stop cascades from
+# Candidate/Position/Election/Voter deleting votes in one statement.
+# Deletes drop tallies once per position instead (below, VoteAdmin, and
+# admin_reset_election).
+@receiver(post_save, sender=Vote)
+def vote_changed(sender, instance, **kwargs):
+    position_id = instance.position_id
+    transaction.on_commit(lambda: invalidate_position_tally(position_id))
+
+
+@receiver(pre_delete, sender=Candidate)
+def candidate_deleted(sender, instance, **kwargs):
+    position_id = instance.position_id
+    transaction.on_commit(lambda: invalidate_position_tally(position_id))
+
+
+@receiver(pre_delete, sender=Position)
+def position_deleted(sender, instance, **kwargs):
+    position_id = instance.id
+    transaction.on_commit(lambda: invalidate_position_tally(position_id))
+
+
+@receiver([post_save, post_delete], sender=Voter)
+def voter_changed(sender, instance, **kwargs):
+    # Never lazy-load a deferred token: in post_delete the row is gone.
+    token = instance.__dict__.get("session_token")
+    # One round trip per voter: the session entry and the admin stats.
+    keys = [ADMIN_STATS_CACHE_KEY]
+    if token:
+        keys.append(voter_session_key(token))
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+@receiver([post_save, post_delete], sender=Election)
+def election_changed(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_active_election)
+
+
+@receiver([post_save, post_delete], sender=Position)
+def position_changed(sender, instance, **kwargs):
+    election_id = instance.election_id
+    transaction.on_commit(lambda: invalidate_active_positions(election_id))
@@ -1,3 +1,548 @@
-from django.test import TestCase
+import base64
+import io
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+
+from .caching import (
+    LOGIN_MAX_ATTEMPTS,
+    get_active_positions,
+    get_position_tallies,
+    login_attempts_key,
+    record_login_attempt,
+    results_cache_key,
+    tally_cache_key,
+)
+from .models import Candidate, Election, Nomination, Position, Vote, Voter
+from . import views
+from .views import (
+    ADMIN_TOKEN_MAX_AGE_SECONDS,
+    VOTER_BULK_MAX_ROWS,
+    create_admin_token,
+    read_admin_token,
+)
+
+
+class ElectionTestCase(TestCase):
+    """Active election in its voting window, one position, one candidate."""
+
+    def setUp(self):
+        cache.clear()
+        now = timezone.now()
+        self.election = Election.objects.create(
+            name="Test Election",
+            nomination_start=now - timedelta(days=3),
+            nomination_end=now - timedelta(days=2),
+            voting_start=now - timedelta(hours=1),
+            voting_end=now + timedelta(days=1),
+            is_active=True,
+        )
+        self.position = Position.objects.create(election=self.election, name="president")
+        self.candidate = Candidate.objects.create(
+            position=self.position, full_name="Ana Reyes", batch_year=2001
+        )
+
+    def make_voter(self, pin="123456", **kwargs):
+        kwargs.setdefault("name", "Juan Cruz")
+        kwargs.setdefault("batch_year", 2000)
+        kwargs.setdefault("privacy_consent", True)
+        voter = Voter(**kwargs)
+        voter.set_pin(pin)
+        voter.save()
+        return voter
+
+    def admin_headers(self):
+        admin = User.objects.create_user("staff", password="pw", is_staff=True)
+        return {"HTTP_X_ADMIN_TOKEN": create_admin_token(admin)}
+
+    def login(self, voter, pin="123456"):
+        response = self.client.post(
+            "/api/voter/login/",
+            {"voter_id": voter.voter_id, "pin": pin},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()["token"]
+
+
+class VoterAdminTests(ElectionTestCase):
+    def test_delete_selected_voters(self):
+        voters = [self.make_voter(), self.make_voter(name="Maria Santos")]
+        self.login(voters[0])
+        self.client.force_login(User.objects.create_superuser("admin", "", "pw"))
+        response = self.client.post(
+            "/admin/elections/voter/",
+            {
+                "action": "delete_selected",
+                "_selected_action": [v.pk for v in voters],
+                "post": "yes",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Voter.objects.exists())
+
+
+class VoterSessionTests(ElectionTestCase):
+    def authenticated(self, token):
+        response = self.client.get("/api/voter/me/", HTTP_X_SESSION_TOKEN=token)
+        return response.json()["authenticated"]
+
+    def test_new_login_revokes_previous_token(self):
+        voter = self.make_voter()
+        old_token = self.login(voter)
+        self.assertTrue(self.authenticated(old_token))  # now cached
+
+        new_token = self.login(voter)
+        self.assertFalse(self.authenticated(old_token))
+        self.assertTrue(self.authenticated(new_token))
+
+    def test_logout_revokes_token(self):
+        voter = self.make_voter()
+        token = self.login(voter)
+        self.assertTrue(self.authenticated(token))
+
+        self.client.post("/api/voter/logout/", HTTP_X_SESSION_TOKEN=token)
+        self.assertFalse(self.authenticated(token))
+
+    def test_logout_invalidates_after_ending_the_session(self):
+        voter = self.make_voter()
+        token = self.login(voter)
+        calls = []
+
+        def end_session(voter_self):
+            calls.append("end_session")
+            original_end_session(voter_self)
+
+        def invalidate(tokens):
+            calls.append("invalidate")
+            original_invalidate(tokens)
+
+        original_end_session = Voter.end_session
+        original_invalidate = views.invalidate_voter_sessions
+        with mock.patch.object(Voter, "end_session", end_session), mock.patch.object(
+            views, "invalidate_voter_sessions", invalidate
+        ):
+            self.client.post("/api/voter/logout/", HTTP_X_SESSION_TOKEN=token)
+        self.assertEqual(calls, ["end_session", "invalidate"])
+        self.assertFalse(self.authenticated(token))
+
+
+class VoterLoginLockoutTests(ElectionTestCase):
+    def post_login(self, voter, pin, ip="10.0.0.1"):
+        return self.client.post(
+            "/api/voter/login/",
+            {"voter_id": voter.voter_id, "pin": pin},
+            content_type="application/json",
+            REMOTE_ADDR=ip,
+        )
+
+    def fail(self, voter, times, ip="10.0.0.1"):
+        for _ in range(times):
+            self.assertEqual(self.post_login(voter, "000000", ip).status_code, 400)
+
+    def test_locked_after_max_attempts_even_with_correct_pin(self):
+        voter = self.make_voter()
+        self.fail(voter, LOGIN_MAX_ATTEMPTS)
+        self.assertEqual(self.post_login(voter, "123456").status_code, 429)
+
+    def test_lockout_does_not_reach_other_clients(self):
+        voter = self.make_voter()
+        self.fail(voter, LOGIN_MAX_ATTEMPTS, ip="203.0.113.9")
+        self.assertEqual(self.post_login(voter, "123456", ip="10.0.0.1").status_code, 200)
+
+    def test_successful_login_resets_count(self):
+        voter = self.make_voter()
+        self.fail(voter, LOGIN_MAX_ATTEMPTS - 1)
+        self.assertEqual(self.post_login(voter, "123456").status_code, 200)
+        self.fail(voter, LOGIN_MAX_ATTEMPTS - 1)
+        self.assertEqual(self.post_login(voter, "123456").status_code, 200)
+
+    def test_attempts_are_counted_before_the_pin_check(self):
+        voter = self.make_voter()
+        self.fail(voter, LOGIN_MAX_ATTEMPTS)
+        self.assertEqual(
+            cache.get(login_attempts_key(voter.voter_id, "10.0.0.1")), LOGIN_MAX_ATTEMPTS
+        )
+        # Each further attempt is counted (atomically) and refused.
+        self.assertEqual(record_login_attempt(voter.voter_id, "10.0.0.1"), LOGIN_MAX_ATTEMPTS + 1)
+        self.assertEqual(self.post_login(voter, "123456").status_code, 429)
+
+
+class NominateTests(ElectionTestCase):
+    def setUp(self):
+        super().setUp()
+        now = timezone.now()
+        self.election.nomination_start = now - timedelta(hours=1)
+        self.election.nomination_end = now + timedelta(hours=1)
+        self.election.save()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media_override = override_settings(MEDIA_ROOT=self.media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.token = self.login(self.make_voter())
+
+    def nominate(self):
+        buf = io.BytesIO()
+        Image.new("RGB", (4, 4)).save(buf, "PNG")
+        return self.client.post(
+            "/api/nominate/",
+            {
+                "position_id": self.position.id,
+                "nominee_full_name": "Pedro Lim",
+                "nominee_batch_year": 1999,
+                "nominee_photo": SimpleUploadedFile("photo.png", buf.getvalue(), "image/png"),
+            },
+            HTTP_X_SESSION_TOKEN=self.token,
+        )
+
+    def stored_photos(self):
+        return [name for _, _, names in os.walk(self.media_root) for name in names]
+
+    def test_duplicate_nomination_stores_no_photo(self):
+        self.assertEqual(self.nominate().status_code, 201)
+        for _ in range(3):
+            self.assertEqual(self.nominate().status_code, 400)
+        self.assertEqual(Nomination.objects.count(), 1)
+        self.assertEqual(len(self.stored_photos()), 1)
+
+    def test_concurrent_duplicate_removes_its_photo(self):
+        self.assertEqual(self.nominate().status_code, 201)
+        # Lose the race: pass the pre-check, then hit the unique constraint.
+        with mock.patch.object(QuerySet, "exists", return_value=False):
+            self.assertEqual(self.nominate().status_code, 400)
+        self.assertEqual(len(self.stored_photos()), 1)
+
+
+class AdminVotersBulkTests(ElectionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.headers = self.admin_headers()
+
+    def post_bulk(self, rows):
+        return self.client.post(
+            "/api/admin/voters/bulk/", rows, content_type="application/json", **self.headers
+        )
+
+    def test_creates_voters_and_returns_pins(self):
+        response = self.post_bulk(
+            [
+                {"name": "Rosa Diaz", "batch_year": 1995, "pin": "246810"},
+                {"name": "Ben Tan", "batch_year": 2003},
+            ]
+        )
+        self.assertEqual(response.status_code, 201)
+        rows = {row["name"]: row for row in response.json()}
+        self.assertEqual(rows["Rosa Diaz"]["pin"], "246810")
+        self.assertEqual(len(rows["Ben Tan"]["pin"]), 6)
+        for row in rows.values():
+            voter = Voter.objects.get(voter_id=row["voter_id"])
+            self.assertTrue(voter.check_pin(row["pin"]))
+
+    def test_row_errors_create_nothing(self):
+        response = self.post_bulk(
+            [{"name": "Rosa Diaz", "batch_year": 1995}, {"name": "", "batch_year": "x"}]
+        )
+        self.assertEqual(response.status_code, 400)
+        # Errors are keyed by row index; valid rows are left out.
+        self.assertEqual(response.json().keys(), {"1"})
+        self.assertEqual(set(response.json()["1"]), {"name", "batch_year"})
+        self.assertFalse(Voter.objects.exists())
+
+    def test_empty_list_is_rejected(self):
+        self.assertEqual(self.post_bulk([]).status_code, 400)
+
+    def test_batch_size_is_capped(self):
+        rows = [{"name": "Rosa Diaz", "batch_year": 1995}] * (VOTER_BULK_MAX_ROWS + 1)
+        self.assertEqual(self.post_bulk(rows).status_code, 400)
+        self.assertFalse(Voter.objects.exists())
+
+    def test_voter_id_conflict_returns_409(self):
+        taken = self.make_voter().voter_id
+        with mock.patch("elections.views.generate_voter_ids", return_value=[taken]):
+            response = self.post_bulk([{"name": "Rosa Diaz", "batch_year": 1995}])
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Voter.objects.count(), 1)
+
+    def test_invalidates_admin_stats(self):
+        self.make_voter()
+        stats = self.client.get("/api/admin/stats/", **self.headers).json()
+        self.assertEqual(stats["total_voters"], 1)
+
+        self.post_bulk([{"name": "Rosa Diaz", "batch_year": 1995}])
+        stats = self.client.get("/api/admin/stats/", **self.headers).json()
+        self.assertEqual(stats["total_voters"], 2)
+
+
+class AdminTokenTests(SimpleTestCase):
+    user = SimpleNamespace(id=42)
+
+    def test_round_trip(self):
+        self.assertEqual(read_admin_token(create_admin_token(self.user)), 42)
+
+    def test_expired(self):
+        token = create_admin_token(self.user)
+        later = time.time() + ADMIN_TOKEN_MAX_AGE_SECONDS + 1
+        with mock.patch("elections.views.time.time", return_value=later):
+            self.assertIsNone(read_admin_token(token))
+
+    def test_tampered_tag(self):
+        raw = bytearray(base64.urlsafe_b64decode(create_admin_token(self.user) + "=="))
+        raw[-1] ^= 1
+        token = base64.urlsafe_b64encode(bytes(raw)).rstrip(b"=").decode()
+        self.assertIsNone(read_admin_token(token))
+
+    def test_tampered_user_id(self):
+        raw = bytearray(base64.urlsafe_b64decode(create_admin_token(self.user) + "=="))
+        raw[7] = 1  # low byte of the user id
+        token = base64.urlsafe_b64encode(bytes(raw)).rstrip(b"=").decode()
+        self.assertIsNone(read_admin_token(token))
+
+    def test_truncated_and_garbage(self):
+        token = create_admin_token(self.user)
+        for bad in (token[:-2], token[:10], "", "not a token!", "\u00e9\u00e9", "A" * 5):
+            with self.subTest(token=bad):
+                self.assertIsNone(read_admin_token(bad))
+
+    def test_other_secret_key(self):
+        with override_settings(SECRET_KEY="another-secret-key"):
+            token = create_admin_token(self.user)
+        self.assertIsNone(read_admin_token(token))
+
+
+class SubmitBallotTests(ElectionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.voter = self.make_voter()
+        self.token = self.login(self.voter)
+
+    def submit(self, votes):
+        return self.client.post(
+            "/api/ballot/submit/",
+            {"votes": votes},
+            content_type="application/json",
+            HTTP_X_SESSION_TOKEN=self.token,
+        )
+
+    def assert_not_voted(self):
+        self.voter.refresh_from_db()
+        self.assertFalse(self.voter.has_voted)
+
+    def test_submit(self):
+        self.assertEqual(self.submit({self.position.id: self.candidate.id}).status_code, 201)
+        self.voter.refresh_from_db()
+        self.assertTrue(self.voter.has_voted)
+        self.assertEqual(Vote.objects.filter(voter=self.voter).count(), 1)
+
+    def test_second_submit_writes_nothing(self):
+        self.submit({self.position.id: self.candidate.id})
+        response = self.submit({self.position.id: self.candidate.id})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Vote.objects.filter(voter=self.voter).count(), 1)
+
+    def test_second_submit_with_stale_session_writes_nothing(self):
+        # The cached session still says has_voted=False; the claim UPDATE
+        # is what refuses the ballot.
+        Voter.objects.filter(pk=self.voter.pk).update(has_voted=True)
+        self.assertEqual(self.submit({self.position.id: self.candidate.id}).status_code, 400)
+        self.assertFalse(Vote.objects.exists())
+
+    def test_bad_candidate_is_rejected(self):
+        other = Position.objects.create(election=self.election, name="secretary")
+        wrong = Candidate.objects.create(position=other, full_name="Lito Sy", batch_year=1990)
+        response = self.submit({self.position.id: wrong.id, other.id: self.candidate.id})
+        self.assertEqual(response.status_code, 400)
+        self.assert_not_voted()
+        self.assertFalse(Vote.objects.exists())
+
+    def test_failed_insert_rolls_back_the_claim(self):
+        Vote.objects.create(voter=self.voter, position=self.position, candidate=self.candidate)
+        response = self.submit({self.position.id: self.candidate.id})
+        self.assertEqual(response.status_code, 400)
+        self.assert_not_voted()
+        self.assertEqual(Vote.objects.count(), 1)
+
+    def test_incomplete_ballot_is_rejected(self):
+        other = Position.objects.create(election=self.election, name="secretary")
+        Candidate.objects.create(position=other, full_name="Lito Sy", batch_year=1990)
+        self.assertEqual(self.submit({self.position.id: self.candidate.id}).status_code, 400)
+        self.assertEqual(
+            self.submit({self.position.id: self.candidate.id, other.id + 100: 1}).status_code,
+            400,
+        )
+        self.assert_not_voted()
+        self.assertFalse(Vote.objects.exists())
+
+
+class PinHasherTests(ElectionTestCase):
+    def test_new_pins_use_the_pin_hasher(self):
+        voter = self.make_voter()
+        self.assertTrue(voter.pin.startswith("pbkdf2_pin$10000$"))
+        self.assertTrue(voter.check_pin("123456"))
+        self.assertFalse(voter.check_pin("654321"))
+
+    def test_default_hasher_pin_is_rehashed_on_login(self):
+        voter = self.make_voter()
+        Voter.objects.filter(pk=voter.pk).update(pin=make_password("123456"))
+        voter.refresh_from_db()
+        self.assertTrue(voter.pin.startswith("pbkdf2_sha256$"))
+
+        self.login(voter)
+        voter.refresh_from_db()
+        self.assertTrue(voter.pin.startswith("pbkdf2_pin$10000$"))
+        self.assertTrue(voter.check_pin("123456"))
+
+
+class AdminResetVotersTests(ElectionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.headers = self.admin_headers()
+        self.voter = self.make_voter()
+        self.token = self.login(self.voter)
+        Voter.objects.filter(pk=self.voter.pk).update(
+            has_voted=True, is_active=False, updated_at=timezone.now() - timedelta(days=1)
+        )
+        self.voter.refresh_from_db()
+
+    def reset(self, **data):
+        response = self.client.post(
+            "/api/admin/reset-voters/", data, content_type="application/json", **self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def assert_reset(self):
+        before = self.voter.updated_at
+        self.voter.refresh_from_db()
+        self.assertFalse(self.voter.has_voted)
+        self.assertTrue(self.voter.is_active)
+        self.assertIsNone(self.voter.session_token)
+        self.assertGreater(self.voter.updated_at, before)
+
+    def test_reset(self):
+        self.assertEqual(self.reset()["updated"], [])
+        self.assert_reset()
+        self.assertTrue(self.voter.check_pin("123456"))
+
+    def test_reset_with_new_pins(self):
+        updated = self.reset(reset_pins=True)["updated"]
+        self.assert_reset()
+        self.assertEqual([row["voter_id"] for row in updated], [self.voter.voter_id])
+        self.assertTrue(self.voter.check_pin(updated[0]["pin"]))
+
+
+class AdminResetElectionTests(ElectionTestCase):
+    def test_reset(self):
+        headers = self.admin_headers()
+        voter = self.make_voter()
+        nomination = Nomination.objects.create(
+            election=self.election,
+            position=self.position,
+            nominator=voter,
+            nominee_full_name="Pedro Lim",
+            nominee_batch_year=1999,
+        )
+        (promoted,) = Candidate.promote_bulk([nomination])
+        token = self.login(voter)
+        self.client.post(
+            "/api/ballot/submit/",
+            {"votes": {self.position.id: self.candidate.id}},
+            content_type="application/json",
+            HTTP_X_SESSION_TOKEN=token,
+        )
+        self.election.results_published = True
+        self.election.results_published_at = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.election.save()
+        results = self.client.get("/api/elections/results/").json()
+        self.assertEqual(results["positions"][0]["candidates"][0]["votes"], 1)
+        self.assertIsNotNone(cache.get(tally_cache_key(self.position.id)))
+        self.assertIsNotNone(cache.get(results_cache_key(self.election)))
+
+        response = self.client.post("/api/admin/reset-election/", **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["votes_deleted"], 1)
+        self.assertEqual(response.json()["nominations_deleted"], 1)
+
+        self.assertFalse(Vote.objects.exists())
+        self.assertFalse(Nomination.objects.exists())
+        promoted.refresh_from_db()
+        self.assertIsNone(promoted.source_nomination_id)
+        self.assertIsNone(cache.get(tally_cache_key(self.position.id)))
+        self.assertIsNone(cache.get(results_cache_key(self.election)))
+        voter.refresh_from_db()
+        self.assertFalse(voter.has_voted)
+
+
+class TallyInvalidationTests(ElectionTestCase):
+    def setUp(self):
+        super().setUp()
+        self.voters = [self.make_voter(name=f"Voter {i}") for i in range(3)]
+        Vote.objects.bulk_create(
+            Vote(voter=v, position=self.position, candidate=self.candidate) for v in self.voters
+        )
+        get_position_tallies([self.position.id])
+
+    def test_candidate_delete_removes_votes_in_one_statement(self):
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as ctx:
+            self.candidate.delete()
+        vote_table = Vote._meta.db_table
+        vote_queries = [q["sql"] for q in ctx.captured_queries if vote_table in q["sql"]]
+        self.assertEqual(len(vote_queries), 1)
+        self.assertTrue(vote_queries[0].startswith("DELETE"))
+        self.assertFalse(Vote.objects.exists())
+        self.assertIsNone(cache.get(tally_cache_key(self.position.id)))
+
+    def test_admin_vote_delete_drops_tally(self):
+        self.client.force_login(User.objects.create_superuser("admin", "", "pw"))
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                "/admin/elections/vote/",
+                {
+                    "action": "delete_selected",
+                    "_selected_action": list(Vote.objects.values_list("pk", flat=True)[:1]),
+                    "post": "yes",
+                },
+            )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Vote.objects.count(), 2)
+        self.assertIsNone(cache.get(tally_cache_key(self.position.id)))
+
+
+class CommitInvalidationTests(ElectionTestCase):
+    def test_position_change_is_seen_after_commit(self):
+        self.assertEqual(get_active_positions(self.election.id), [(self.position.id, "president")])
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.position.is_active = False
+            self.position.save()
+            # Not committed yet: the cached (committed) positions stay.
+            self.assertEqual(len(get_active_positions(self.election.id)), 1)
+        for callback in callbacks:
+            callback()
+        self.assertEqual(get_active_positions(self.election.id), [])
+
+    def test_voter_deactivation_ends_cached_session_after_commit(self):
+        voter = self.make_voter()
+        token = self.login(voter)
+        me = lambda: self.client.get("/api/voter/me/", HTTP_X_SESSION_TOKEN=token).json()
+        self.assertTrue(me()["authenticated"])
+        voter.refresh_from_db()  # as the admin change form loads it
+        with self.captureOnCommitCallbacks(execute=True):
+            voter.is_active = False
+            voter.save()
+        self.assertFalse(me()["authenticated"])
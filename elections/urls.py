@@ -1,16 +1,43 @@
 # elections/urls.py
-from django.urls import path
+from django.urls import include, path
 
 from . import views
 
+# Routes are grouped by prefix so the resolver matches "voter/", "elections/"
+# or "admin/" once and then only walks that subtree.
+
+voter_patterns = [
+    path("login/", views.voter_login),
+    path("logout/", views.voter_logout),
+    path("me/", views.voter_me),
+]
+
+election_patterns = [
+    path("current/", views.current_election),
+    path("results/", views.published_results),
+]
+
+admin_patterns = [
+    path("login/", views.admin_login),
+    path("logout/", views.admin_logout),
+    path("me/", views.admin_me),
+    path("voters/", views.admin_voters),
+    path("voters/bulk/", views.admin_voters_bulk),
+    path("tally/", views.admin_tally),
+    path("stats/", views.admin_stats),
+    path("nominations/", views.admin_nominations),
+    path("nominations/<int:nomination_id>/promote/", views.admin_promote_nomination),
+    path("reminders/", views.admin_reminders),
+    path("election/active/", views.admin_active_election),
+    path("election/publish/", views.admin_publish_results),
+    path("reset-voters/", views.admin_reset_voters),
+    path("reset-election/", views.admin_reset_election),
+]
+
 urlpatterns = [
     # Public / Voter
-    path("voter/login/", views.voter_login),
-    path("voter/logout/", views.voter_logout),
-    path("voter/me/", views.voter_me),
-
-    path("elections/current/", views.current_election),
-    path("elections/results/", views.published_results),
+    path("voter/", include(voter_patterns)),
+    path("elections/", include(election_patterns)),
     path("positions/", views.positions_list),
     path("candidates/", views.candidates_list),
 
@@ -21,17 +48,5 @@ urlpatterns = [
     path("my-votes/", views.my_votes),
 
     # Admin / Staff
-    path("admin/login/", views.admin_login),
-    path("admin/logout/", views.admin_logout),
-    path("admin/me/", views.admin_me),
-    path("admin/voters/", views.admin_voters),
-    path("admin/tally/", views.admin_tally),
-    path("admin/stats/", views.admin_stats),
-    path("admin/nominations/", views.admin_nominations),
-    path("admin/nominations/<int:nomination_id>/promote/", views.admin_promote_nomination),
-    path("admin/reminders/", views.admin_reminders),
-    path("admin/election/active/", views.admin_active_election),
-    path("admin/election/publish/", views.admin_publish_results),
-    path("admin/reset-voters/", views.admin_reset_voters),
-    path("admin/reset-election/", views.admin_reset_election),
+    path("admin/", include(admin_patterns)),
 ]
@@ -1,16 +1,44 @@
 # elections/views.py
-from datetime import datetime
-import random
-
+import base64
+import hashlib
+import hmac
+import struct
+import time
+import uuid
+from functools import lru_cache
+
+from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
-from django.core import signing
-from django.db import transaction
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, Prefetch, Q
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.views.decorators.http import conditional_page
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from .caching import (
+    ADMIN_DASHBOARD_TIMEOUT,
+    ADMIN_STATS_CACHE_KEY,
+    LOGIN_MAX_ATTEMPTS,
+    RESULTS_TIMEOUT,
+    admin_tally_cache_key,
+    clear_login_attempts,
+    get_active_positions,
+    get_cached_active_election,
+    get_position_tallies,
+    get_session_voter,
+    invalidate_admin_dashboard,
+    invalidate_position_tally,
+    invalidate_published_results,
+    invalidate_voter_sessions,
+    record_login_attempt,
+    results_cache_key,
+)
 from .models import (
     Candidate,
     Election,
@@ -19,7 +47,9 @@ from .models import (
     Voter,
     Vote,
     ElectionReminder,
+    POSITION_DISPLAY,
     generate_pin,
+    generate_voter_ids,
 )
 from .serializers import (
     BallotSubmitSerializer,
@@ -30,20 +60,33 @@ from .serializers import (
     PositionSerializer,
     VoterMeSerializer,
     VoterSerializer,
-    VoteSerializer,
     AdminVoterCreateSerializer,
     ElectionReminderSerializer,
 )
 
 User = get_user_model()
 
+# VoterMeSerializer's fields are all plain attributes; read them directly
+# instead of building a serializer per request.
+VOTER_ME_FIELDS = tuple(VoterMeSerializer().fields)
+
+
+def _voter_payload(voter):
+    return {field: getattr(voter, field) for field in VOTER_ME_FIELDS}
+
 
 # =======================
 #  HELPERS
 # =======================
 
-def get_active_election():
-    return Election.objects.filter(is_active=True).order_by("-nomination_start").first()
+def get_active_election(request=None):
+    """Return the active election, memoized on the request when one is given."""
+    if request is not None and hasattr(request, "_active_election"):
+        return request._active_election
+    election = get_cached_active_election()
+    if request is not None:
+        request._active_election = election
+    return election
 
 
 def get_authenticated_voter(request):
@@ -51,27 +94,26 @@ def get_authenticated_voter(request):
     if not token:
         return None
     try:
-        return Voter.objects.get(session_token=token, is_active=True)
-    except Voter.DoesNotExist:
+        session_token = uuid.UUID(token)
+    except ValueError:
         return None
+    return get_session_voter(session_token)
 
 
 def get_admin_from_request(request):
-    token = request.headers.get("X-Admin-Token")
+    if hasattr(request, "_admin_user"):
+        return request._admin_user
+    request._admin_user = _load_admin(request.headers.get("X-Admin-Token"))
+    return request._admin_user
+
+
+def _load_admin(token):
     if not token:
         return None
-    try:
-        data = signing.loads(
-            token,
-            salt=ADMIN_SALT,
-            max_age=ADMIN_TOKEN_MAX_AGE_SECONDS,
-        )
-        user_id = data.get("user_id")
-        if not user_id:
-            return None
-        return User.objects.get(id=user_id, is_staff=True)
-    except (signing.BadSignature, signing.SignatureExpired, User.DoesNotExist):
+    user_id = read_admin_token(token)
+    if not user_id:
         return None
+    return User.objects.filter(id=user_id, is_staff=True).first()
 
 
 # =======================
@@ -87,20 +129,39 @@ def voter_login(request):
     if not voter_id or not pin:
         return Response({"error": "voter_id and pin are required"}, status=400)
 
-    try:
-        voter = Voter.objects.get(voter_id=voter_id, is_active=True)
-    except Voter.DoesNotExist:
+    # Counted before the PIN check, so a correct guess past the limit is
+    # refused too.
+    client_ip = request.META.get("REMOTE_ADDR", "")
+    if record_login_attempt(voter_id, client_ip) > LOGIN_MAX_ATTEMPTS:
+        return Response(
+            {"error": "Too many login attempts. Try again later."},
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+        )
+
+    # Login reads the PIN hash and the voter/me fields, never the timestamps.
+    voter = (
+        Voter.objects.defer("created_at", "updated_at")
+        .filter(voter_id=voter_id, is_active=True)
+        .first()
+    )
+    if voter is None:
         return Response({"error": "Invalid credentials"}, status=400)
 
     if not voter.check_pin(pin):
         return Response({"error": "Invalid credentials"}, status=400)
 
+    clear_login_attempts(voter_id, client_ip)
+    old_token = voter.session_token
     voter.start_session()
+    # Drop the replaced session's cache entry; deleting it after the UPDATE
+    # means a concurrent request cannot cache the old token again.
+    invalidate_voter_sessions([old_token])
 
     return Response(
         {
-            "token": voter.session_token,
-            "voter": VoterMeSerializer(voter).data,
+            # 32 hex chars; the dashed form is still accepted on lookup.
+            "token": voter.session_token.hex,
+            "voter": _voter_payload(voter),
         }
     )
 
@@ -109,7 +170,10 @@ def voter_login(request):
 def voter_logout(request):
     voter = get_authenticated_voter(request)
     if voter:
+        old_token = voter.session_token
         voter.end_session()
+        # After the UPDATE, as in voter_login, so it cannot be re-cached.
+        invalidate_voter_sessions([old_token])
     return Response({"message": "Logged out"})
 
 
@@ -118,7 +182,7 @@ def voter_me(request):
     voter = get_authenticated_voter(request)
     if not voter:
         return Response({"authenticated": False}, status=200)
-    return Response({"authenticated": True, "voter": VoterMeSerializer(voter).data})
+    return Response({"authenticated": True, "voter": _voter_payload(voter)})
 
 
 # =======================
@@ -128,16 +192,18 @@ def voter_me(request):
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def current_election(request):
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response({"has_election": False}, status=200)
     return Response({"has_election": True, "election": ElectionSerializer(election).data})
 
 
+# ETag from the response body; an unchanged body gets 304 Not Modified.
+@conditional_page
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def positions_list(request):
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response([], status=200)
     positions = Position.objects.filter(election=election, is_active=True).order_by(
@@ -149,20 +215,22 @@ def positions_list(request):
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def candidates_list(request):
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response([], status=200)
-    qs = Candidate.objects.filter(position__election=election, is_official=True)
+    qs = CandidateSerializer.setup_eager_loading(
+        Candidate.objects.filter(position__election=election, is_official=True)
+    )
     position_id = request.query_params.get("position")
     if position_id:
         qs = qs.filter(position_id=position_id)
-    qs = qs.order_by("position__display_order", "full_name")
     # shuffle per request for ballot rendering (simple random sample)
-    candidates = list(qs)
-    random.shuffle(candidates)
-    return Response(CandidateSerializer(candidates, many=True).data)
+    qs = qs.order_by("?")
+    return Response(CandidateSerializer(qs, many=True).data)
 
 
+# ETag from the response body; an unchanged body gets 304 Not Modified.
+@conditional_page
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def published_results(request):
@@ -170,33 +238,51 @@ def published_results(request):
     Public: return per-position vote totals for the active election
     only when results are officially published.
     """
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response({"published": False, "reason": "no_active_election"}, status=200)
     if not election.results_published:
         return Response({"published": False, "reason": "not_published"}, status=200)
 
-    positions = Position.objects.filter(election=election, is_active=True).order_by(
-        "display_order", "name"
+    data = cache.get_or_set(
+        results_cache_key(election),
+        lambda: _results_payload(election),
+        RESULTS_TIMEOUT,
+    )
+    return Response(data)
+
+
+def _results_payload(election):
+    positions = list(
+        Position.objects.filter(election=election, is_active=True)
+        .only("id", "name")
+        .order_by("display_order", "name")
+        .prefetch_related(
+            Prefetch(
+                "candidates",
+                queryset=Candidate.objects.filter(is_official=True)
+                .only("id", "position_id", "full_name", "batch_year", "campus_chapter")
+                .order_by("full_name"),
+                to_attr="official_candidates",
+            )
+        )
     )
+    tallies = get_position_tallies([pos.id for pos in positions])
     results_payload = []
     for pos in positions:
-        candidates = Candidate.objects.filter(position=pos, is_official=True).order_by("full_name")
         # compute votes per candidate
-        cand_data = []
-        max_votes = 0
-        for cand in candidates:
-            votes_count = Vote.objects.filter(position=pos, candidate=cand).count()
-            max_votes = max(max_votes, votes_count)
-            cand_data.append(
-                {
-                    "id": cand.id,
-                    "full_name": cand.full_name,
-                    "batch_year": cand.batch_year,
-                    "campus_chapter": cand.campus_chapter,
-                    "votes": votes_count,
-                }
-            )
+        tally = tallies[pos.id]
+        cand_data = [
+            {
+                "id": cand.id,
+                "full_name": cand.full_name,
+                "batch_year": cand.batch_year,
+                "campus_chapter": cand.campus_chapter,
+                "votes": tally.get(cand.id, 0),
+            }
+            for cand in pos.official_candidates
+        ]
+        max_votes = max((entry["votes"] for entry in cand_data), default=0)
         # flag winners (ties allowed)
         for entry in cand_data:
             entry["winner"] = max_votes > 0 and entry["votes"] == max_votes
@@ -209,17 +295,15 @@ def published_results(request):
             }
         )
 
-    return Response(
-        {
-            "published": True,
-            "published_at": election.results_published_at,
-            "election": {
-                "id": election.id,
-                "name": election.name,
-            },
-            "positions": results_payload,
-        }
-    )
+    return {
+        "published": True,
+        "published_at": election.results_published_at,
+        "election": {
+            "id": election.id,
+            "name": election.name,
+        },
+        "positions": results_payload,
+    }
 
 # =======================
 #  NOMINATIONS
@@ -234,7 +318,7 @@ def nominate(request):
     if not voter.privacy_consent:
         return Response({"error": "Consent is required"}, status=400)
 
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response({"error": "No active election"}, status=400)
 
@@ -253,11 +337,12 @@ def nominate(request):
     except Position.DoesNotExist:
         return Response({"error": "Invalid position"}, status=404)
 
-    # enforce one nomination per voter per election
+    # One nomination per voter per election. Check first: saving writes
+    # the photo to storage before the INSERT can be rejected.
     if Nomination.objects.filter(election=election, nominator=voter).exists():
         return Response({"error": "You already submitted a nomination"}, status=400)
 
-    nomination = Nomination.objects.create(
+    nomination = Nomination(
         election=election,
         position=position,
         nominator=voter,
@@ -270,6 +355,15 @@ def nominate(request):
         nominee_photo=data.get("nominee_photo"),
         is_good_standing=data.get("is_good_standing", False),
     )
+    # unique_together still settles concurrent submits
+    try:
+        with transaction.atomic():
+            nomination.save()
+    except IntegrityError:
+        if nomination.nominee_photo:
+            # The rejected request's upload was already stored.
+            nomination.nominee_photo.delete(save=False)
+        return Response({"error": "You already submitted a nomination"}, status=400)
 
     return Response(NominationSerializer(nomination).data, status=201)
 
@@ -280,12 +374,14 @@ def my_nomination(request):
     if not voter:
         return Response({"error": "Authentication required"}, status=401)
 
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response({"error": "No active election"}, status=400)
 
     try:
-        nomination = Nomination.objects.get(election=election, nominator=voter)
+        nomination = NominationSerializer.setup_eager_loading(Nomination.objects).get(
+            election=election, nominator=voter
+        )
     except Nomination.DoesNotExist:
         return Response({}, status=200)
 
@@ -308,7 +404,7 @@ def submit_ballot(request):
     if voter.has_voted:
         return Response({"error": "You already submitted your ballot"}, status=400)
 
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response({"error": "No active election"}, status=400)
 
@@ -321,42 +417,55 @@ def submit_ballot(request):
 
     votes_payload = ser.validated_data["votes"]
 
-    active_positions = list(
-        Position.objects.filter(election=election, is_active=True).order_by("id")
-    )
-    expected_ids = {str(p.id) for p in active_positions}
+    active_positions = get_active_positions(election.id)
 
-    # ensure one per position and complete ballot
-    if set(map(str, votes_payload.keys())) != expected_ids:
+    # ensure one per position and complete ballot; DictField keys are str,
+    # so equal length plus every position present means an exact match
+    if len(votes_payload) != len(active_positions):
         return Response({"error": "Submit one vote for each position."}, status=400)
-
-    # Pre-validate all selections
     selections = []
-    for position in active_positions:
-        candidate_id = votes_payload.get(str(position.id)) or votes_payload.get(position.id)
-        try:
-            candidate = Candidate.objects.get(
-                id=candidate_id, position=position, is_official=True
-            )
-        except Candidate.DoesNotExist:
-            return Response(
-                {
-                    "error": f"Invalid candidate for position {position.get_name_display()}"
-                },
-                status=400,
-            )
-        selections.append((position, candidate))
+    for position_id, name in active_positions:
+        candidate_id = votes_payload.get(str(position_id))
+        if candidate_id is None:
+            return Response({"error": "Submit one vote for each position."}, status=400)
+        selections.append((position_id, name, candidate_id))
+
+    # Pre-validate all selections with one query
+    candidate_positions = dict(
+        Candidate.objects.filter(
+            id__in=[candidate_id for _, _, candidate_id in selections], is_official=True
+        ).values_list("id", "position_id")
+    )
+    invalid = [
+        POSITION_DISPLAY.get(name, name)
+        for position_id, name, candidate_id in selections
+        if candidate_positions.get(candidate_id) != position_id
+    ]
+    if invalid:
+        return Response(
+            {"error": f"Invalid candidate for position {', '.join(invalid)}"},
+            status=400,
+        )
 
-    with transaction.atomic():
-        for position, candidate in selections:
-            if Vote.objects.filter(voter=voter, position=position).exists():
-                return Response(
-                    {"error": "You already voted for this position"}, status=400
-                )
-            Vote.objects.create(voter=voter, position=position, candidate=candidate)
+    try:
+        with transaction.atomic():
+            # Claim the ballot first; a concurrent submit matches no row.
+            if not Voter.objects.filter(pk=voter.pk, has_voted=False).update(has_voted=True):
+                return Response({"error": "You already submitted your ballot"}, status=400)
+            Vote.objects.bulk_create(
+                Vote(voter=voter, position_id=position_id, candidate_id=candidate_id)
+                for position_id, _, candidate_id in selections
+            )
+    except IntegrityError:
+        # unique (voter, position)
+        return Response({"error": "You already voted for this position"}, status=400)
 
-        voter.has_voted = True
-        voter.save(update_fields=["has_voted"])
+    # bulk_create and update() skip the post_save signals
+    for position_id, _, _ in selections:
+        invalidate_position_tally(position_id)
+    invalidate_voter_sessions([voter.session_token])
+    invalidate_admin_dashboard(election.id)
+    invalidate_published_results(election)
 
     return Response({"message": "Ballot submitted"}, status=201)
 
@@ -387,6 +496,45 @@ def my_votes(request):
 ADMIN_SALT = "admin-session"
 ADMIN_TOKEN_MAX_AGE_SECONDS = 60 * 60 * 12  # 12 hours
 
+# Token layout: user id (8 bytes), expiry timestamp (4 bytes), then a
+# truncated HMAC-SHA256 tag over both, base64url-encoded without padding.
+ADMIN_TOKEN_PAYLOAD = struct.Struct("!QI")
+ADMIN_TOKEN_TAG_BYTES = 16
+
+
+@lru_cache(maxsize=None)
+def _admin_token_key(secret_key):
+    # Same key derivation as salted_hmac(ADMIN_SALT, ...), done once per
+    # SECRET_KEY instead of once per request.
+    return hashlib.sha256(ADMIN_SALT.encode() + secret_key.encode()).digest()
+
+
+def _admin_token_tag(payload):
+    key = _admin_token_key(settings.SECRET_KEY)
+    return hmac.new(key, payload, hashlib.sha256).digest()[:ADMIN_TOKEN_TAG_BYTES]
+
+
+def create_admin_token(user):
+    payload = ADMIN_TOKEN_PAYLOAD.pack(user.id, int(time.time()) + ADMIN_TOKEN_MAX_AGE_SECONDS)
+    return base64.urlsafe_b64encode(payload + _admin_token_tag(payload)).rstrip(b"=").decode()
+
+
+def read_admin_token(token):
+    """Return the user id of a valid, unexpired admin token, else None."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except ValueError:
+        return None
+    if len(raw) != ADMIN_TOKEN_PAYLOAD.size + ADMIN_TOKEN_TAG_BYTES:
+        return None
+    payload, tag = raw[: ADMIN_TOKEN_PAYLOAD.size], raw[ADMIN_TOKEN_PAYLOAD.size :]
+    if not hmac.compare_digest(tag, _admin_token_tag(payload)):
+        return None
+    user_id, expires = ADMIN_TOKEN_PAYLOAD.unpack(payload)
+    if expires < time.time():
+        return None
+    return user_id
+
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
@@ -401,7 +549,7 @@ def admin_login(request):
     if not user or not user.is_staff:
         return Response({"error": "Invalid admin credentials"}, status=400)
 
-    token = signing.dumps({"user_id": user.id}, salt=ADMIN_SALT)
+    token = create_admin_token(user)
 
     return Response(
         {
@@ -441,6 +589,11 @@ def admin_me(request):
 #  ADMIN DATA
 # =======================
 
+class VoterListPagination(LimitOffsetPagination):
+    # No default limit: without ?limit= the full list is returned as before.
+    max_limit = 1000
+
+
 @api_view(["GET", "POST"])
 def admin_voters(request):
     admin_user = get_admin_from_request(request)
@@ -448,8 +601,14 @@ def admin_voters(request):
         return Response({"error": "Admin authentication required"}, status=403)
 
     if request.method == "GET":
-        voters = Voter.objects.all().order_by("name")
-        return Response(VoterSerializer(voters, many=True).data)
+        # All VoterSerializer fields are plain columns; .values() rows
+        # serialize the same without building model instances.
+        voters = Voter.objects.order_by("name", "id").values(*VoterSerializer.Meta.fields)
+        paginator = VoterListPagination()
+        page = paginator.paginate_queryset(voters, request)
+        if page is not None:
+            return paginator.get_paginated_response(page)
+        return Response(list(voters))
 
     serializer = AdminVoterCreateSerializer(data=request.data)
     if not serializer.is_valid():
@@ -469,25 +628,99 @@ def admin_voters(request):
     return Response(out, status=201)
 
 
+# Every row costs a PIN hash inside the request; larger rosters go in
+# several calls.
+VOTER_BULK_MAX_ROWS = 500
+
+
+@api_view(["POST"])
+def admin_voters_bulk(request):
+    """
+    Create many voters at once. Body: a non-empty list of at most
+    VOTER_BULK_MAX_ROWS admin_voters POST objects. Returns the created
+    voters with their raw PINs, like single create.
+    """
+    admin_user = get_admin_from_request(request)
+    if not admin_user:
+        return Response({"error": "Admin authentication required"}, status=403)
+
+    serializer = AdminVoterCreateSerializer(
+        data=request.data, many=True, allow_empty=False, max_length=VOTER_BULK_MAX_ROWS
+    )
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=400)
+
+    rows = serializer.validated_data
+    raw_pins = {}
+    voters = []
+    for data, code in zip(rows, generate_voter_ids(len(rows))):
+        raw_pin = data.pop("pin", "").strip() or generate_pin()
+        voter = Voter(voter_id=code, **data)
+        voter.set_pin(raw_pin)
+        raw_pins[code] = raw_pin
+        voters.append(voter)
+
+    try:
+        with transaction.atomic():
+            Voter.objects.bulk_create(voters, batch_size=VOTER_BULK_MAX_ROWS)
+    except IntegrityError:
+        # A voter ID was taken between the check and the insert.
+        return Response({"error": "Voter ID collision, please retry"}, status=409)
+
+    # bulk_create skips post_save
+    invalidate_admin_dashboard()
+
+    # MySQL does not return primary keys from bulk_create; read them back.
+    out = list(
+        Voter.objects.filter(voter_id__in=raw_pins)
+        .order_by("name")
+        .values(*VoterSerializer.Meta.fields)
+    )
+    for row in out:
+        row["pin"] = raw_pins[row["voter_id"]]
+    return Response(out, status=201)
+
+
 @api_view(["GET"])
 def admin_tally(request):
     admin_user = get_admin_from_request(request)
     if not admin_user:
         return Response({"error": "Admin authentication required"}, status=403)
 
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response([], status=200)
 
+    data = cache.get_or_set(
+        admin_tally_cache_key(election.id),
+        lambda: _tally_payload(election),
+        ADMIN_DASHBOARD_TIMEOUT,
+    )
+    return Response(data)
+
+
+def _tally_payload(election):
     data = []
-    positions = Position.objects.filter(election=election, is_active=True).prefetch_related(
-        "candidates"
+    positions = list(
+        Position.objects.filter(election=election, is_active=True)
+        .only("id", "name")
+        .prefetch_related(
+            Prefetch(
+                "candidates",
+                queryset=Candidate.objects.filter(is_official=True).only(
+                    "id", "position_id", "full_name"
+                ),
+                to_attr="official_candidates",
+            )
+        )
     )
+    tallies = get_position_tallies([pos.id for pos in positions])
 
     for pos in positions:
+        tally = tallies[pos.id]
         candidates_data = []
-        for cand in pos.candidates.filter(is_official=True):
-            votes_count = Vote.objects.filter(position=pos, candidate=cand).count()
+        for cand in pos.official_candidates:
+            votes_count = tally.get(cand.id, 0)
             candidates_data.append(
                 {
                     "candidate_id": cand.id,
@@ -504,7 +737,7 @@ def admin_tally(request):
             }
         )
 
-    return Response(data)
+    return data
 
 
 @api_view(["GET"])
@@ -513,17 +746,25 @@ def admin_stats(request):
     if not admin_user:
         return Response({"error": "Admin authentication required"}, status=403)
 
-    total_voters = Voter.objects.count()
-    voted_count = Voter.objects.filter(has_voted=True).count()
-    turnout_percent = round((voted_count / total_voters * 100), 2) if total_voters else 0.0
-
     return Response(
-        {
-            "total_voters": total_voters,
-            "voted_count": voted_count,
-            "turnout_percent": turnout_percent,
-        }
+        cache.get_or_set(ADMIN_STATS_CACHE_KEY, _stats_payload, ADMIN_DASHBOARD_TIMEOUT)
+    )
+
+
+def _stats_payload():
+    counts = Voter.objects.aggregate(
+        total_voters=Count("id"),
+        voted_count=Count("id", filter=Q(has_voted=True)),
     )
+    total_voters = counts["total_voters"]
+    voted_count = counts["voted_count"]
+    turnout_percent = round((voted_count / total_voters * 100), 2) if total_voters else 0.0
+
+    return {
+        "total_voters": total_voters,
+        "voted_count": voted_count,
+        "turnout_percent": turnout_percent,
+    }
 
 
 @api_view(["GET"])
@@ -532,11 +773,11 @@ def admin_nominations(request):
     if not admin:
         return Response({"error": "Admin authentication required"}, status=403)
 
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response([], status=200)
 
-    qs = Nomination.objects.filter(election=election).select_related("position", "nominator")
+    qs = NominationSerializer.setup_eager_loading(Nomination.objects.filter(election=election))
     return Response(NominationSerializer(qs, many=True).data)
 
 
@@ -582,7 +823,7 @@ def admin_reminders(request):
     if not admin:
         return Response({"error": "Admin authentication required"}, status=403)
 
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         return Response({"error": "No active election"}, status=400)
 
@@ -608,7 +849,7 @@ def admin_active_election(request):
     if not admin:
         return Response({"error": "Admin authentication required"}, status=403)
 
-    election = get_active_election()
+    election = get_active_election(request)
     if not election:
         # Fallback to the most recent election so the admin UI can still edit
         election = Election.objects.order_by("-nomination_start", "-id").first()
@@ -625,12 +866,14 @@ def admin_active_election(request):
         if not val:
             return None
         try:
-            dt = datetime.fromisoformat(val)
-            if timezone.is_naive(dt):
-                dt = timezone.make_aware(dt, timezone.get_current_timezone())
-            return dt
-        except Exception:
+            dt = parse_datetime(val)
+        except (TypeError, ValueError):
+            dt = None
+        if dt is None:
             raise ValueError(f"Invalid datetime for {key}")
+        if timezone.is_naive(dt):
+            dt = timezone.make_aware(dt, timezone.get_current_timezone())
+        return dt
 
     try:
         nomination_start = parse_dt("nomination_start")
@@ -668,7 +911,13 @@ def admin_active_election(request):
 
     for k, v in fields.items():
         setattr(election, k, v)
-    election.save(update_fields=list(fields.keys()))
+    with transaction.atomic():
+        if fields.get("is_active"):
+            # Keep a single active election; one UPDATE, same transaction.
+            Election.objects.filter(is_active=True).exclude(pk=election.pk).update(
+                is_active=False
+            )
+        election.save(update_fields=list(fields.keys()))
 
     return Response(ElectionSerializer(election).data)
 
@@ -683,7 +932,7 @@ def admin_publish_results(request):
     if not admin:
         return Response({"error": "Admin authentication required"}, status=403)
 
-    election = get_active_election() or Election.objects.order_by("-nomination_start", "-id").first()
+    election = get_active_election(request) or Election.objects.order_by("-nomination_start", "-id").first()
     if not election:
         return Response({"error": "No election found"}, status=404)
 
@@ -711,19 +960,37 @@ def admin_reset_voters(request):
 
     reset_pins = bool(request.data.get("reset_pins"))
 
-    voters = Voter.objects.all()
-    count = 0
+    old_tokens = list(
+        Voter.objects.exclude(session_token=None).values_list("session_token", flat=True)
+    )
     output = []
-    for v in voters:
-        v.has_voted = False
-        v.is_active = True
-        v.session_token = None
-        if reset_pins:
+    # update()/bulk_update() don't apply auto_now
+    now = timezone.now()
+    if reset_pins:
+        # Every voter needs its own PIN hash, so write them back in batches.
+        voters = list(Voter.objects.only("id", "voter_id"))
+        for v in voters:
+            v.has_voted = False
+            v.is_active = True
+            v.session_token = None
+            v.updated_at = now
             new_pin = generate_pin()
             v.set_pin(new_pin)
             output.append({"voter_id": v.voter_id, "pin": new_pin})
-        v.save()
-        count += 1
+        with transaction.atomic():
+            Voter.objects.bulk_update(
+                voters,
+                ["has_voted", "is_active", "session_token", "pin", "updated_at"],
+                batch_size=500,
+            )
+        count = len(voters)
+    else:
+        count = Voter.objects.update(
+            has_voted=False, is_active=True, session_token=None, updated_at=now
+        )
+    # update()/bulk_update() skip the post_save signals
+    invalidate_voter_sessions(old_tokens)
+    invalidate_admin_dashboard()
 
     return Response(
         {
@@ -744,20 +1011,41 @@ def admin_reset_election(request):
     if not admin:
         return Response({"error": "Admin authentication required"}, status=403)
 
-    election = get_active_election() or Election.objects.order_by("-nomination_start", "-id").first()
+    election = get_active_election(request) or Election.objects.order_by("-nomination_start", "-id").first()
     if not election:
         return Response({"error": "No election found"}, status=404)
 
-    positions = Position.objects.filter(election=election)
-    votes_deleted, _ = Vote.objects.filter(position__in=positions).delete()
-    nominations_deleted, _ = Nomination.objects.filter(election=election).delete()
+    # Single DELETE statements: no PK SELECT, no collector, no signals.
+    qn = connection.ops.quote_name
+    position_ids = list(Position.objects.filter(election=election).values_list("id", flat=True))
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {qn(Vote._meta.db_table)} WHERE {qn('position_id')} IN "
+            f"(SELECT {qn('id')} FROM {qn(Position._meta.db_table)} WHERE {qn('election_id')} = %s)",
+            [election.id],
+        )
+        votes_deleted = cursor.rowcount
+        # The collector would have SET_NULL'ed these links itself.
+        Candidate.objects.filter(source_nomination__election=election).update(
+            source_nomination=None
+        )
+        cursor.execute(
+            f"DELETE FROM {qn(Nomination._meta.db_table)} WHERE {qn('election_id')} = %s",
+            [election.id],
+        )
+        nominations_deleted = cursor.rowcount
+    for position_id in position_ids:
+        invalidate_position_tally(position_id)
 
-    voters = Voter.objects.all()
-    for v in voters:
-        v.has_voted = False
-        v.session_token = None
-        v.is_active = True
-        v.save(update_fields=["has_voted", "session_token", "is_active"])
+    old_tokens = list(
+        Voter.objects.exclude(session_token=None).values_list("session_token", flat=True)
+    )
+    voters_reset = Voter.objects.update(
+        has_voted=False, session_token=None, is_active=True, updated_at=timezone.now()
+    )
+    invalidate_voter_sessions(old_tokens)
+    invalidate_admin_dashboard(election.id)
+    invalidate_published_results(election)
 
     return Response(
         {
@@ -765,6 +1053,6 @@ def admin_reset_election(request):
             "election": election.id,
             "votes_deleted": votes_deleted,
             "nominations_deleted": nominations_deleted,
-            "voters_reset": voters.count(),
+            "voters_reset": voters_reset,
         }
     )